@@ -1,27 +1,56 @@
+import asyncio
 import os
+import queue
+import socket
 import time
 import threading
 import logging
-from contextlib import asynccontextmanager
-from typing import Optional
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import Annotated, Callable, Optional
 
 import cv2
-import requests
-from fastapi import FastAPI, Response
+import httpx
+import numpy as np
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
+from turbojpeg import TurboJPEG, TJFLAG_FASTDCT, TJPF_BGR, TJSAMP_420
 
 DEVICE = os.getenv("CAM_DEVICE", "/dev/video0")
 WIDTH = int(os.getenv("CAM_WIDTH", "1280"))
 HEIGHT = int(os.getenv("CAM_HEIGHT", "720"))
 FPS = int(os.getenv("CAM_FPS", "15"))
 
+# MJPEG der Kamera unverändert weiterreichen (kein Decode/Encode, aber auch
+# kein Drehen/Skalieren – die Kamera muss die Auflösung selbst liefern)
+JPEG_PASSTHROUGH = os.getenv("JPEG_PASSTHROUGH", "0") == "1"
+
 GST_PIPE = os.getenv(
     "GST_PIPE",
-    f"v4l2src device={DEVICE} ! image/jpeg,framerate={FPS}/1 ! jpegdec ! videoconvert ! appsink",
+    (
+        f"v4l2src device={DEVICE} ! image/jpeg,framerate={FPS}/1,width={WIDTH},height={HEIGHT} ! appsink"
+        if JPEG_PASSTHROUGH
+        else f"v4l2src device={DEVICE} ! image/jpeg,framerate={FPS}/1,width={WIDTH},height={HEIGHT} ! jpegdec ! videoconvert ! appsink"
+    ),
 )
 
 JPEG_QUALITY = int(os.getenv("JPEG_QUALITY", "80"))
+# Schnelle (ifast) DCT: minimal weniger Qualität, spürbar schnellerer Encode
+JPEG_FASTDCT = os.getenv("JPEG_FASTDCT", "1") == "1"
+
+# Jetson: Decode, 180°-Drehung und JPEG-Encode komplett in Hardware (NVJPG)
+JETSON_GST_PIPE = os.getenv(
+    "JETSON_GST_PIPE",
+    f"v4l2src device={DEVICE} ! image/jpeg,framerate={FPS}/1 ! nvv4l2decoder mjpeg=1 "
+    f"! nvvidconv flip-method=2 ! video/x-raw(memory:NVMM),format=I420,width={WIDTH},height={HEIGHT} "
+    f"! nvjpegenc quality={JPEG_QUALITY} ! image/jpeg ! appsink",
+)
+
+# Grabber-/Encoder-Threads: CPU-Kerne (z.B. "2,3") und SCHED_FIFO-Priorität (1-99, 0 = aus)
+GRABBER_CPUS = {int(c) for c in os.getenv("GRABBER_CPUS", "").split(",") if c.strip()}
+GRABBER_RT_PRIORITY = int(os.getenv("GRABBER_RT_PRIORITY", "0"))
 
 # Prusa Connect
 PRUSA_BASE_URL = os.getenv("PRUSA_BASE_URL", "https://webcam.connect.prusa3d.com")
@@ -36,14 +65,66 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(name)s: %(message)s",
 )
 log = logging.getLogger("nx-webcam")
+# httpx loggt jeden Request auf INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # -------------------------
 # App State
 # -------------------------
-_last_jpeg: Optional[bytes] = None
-_cap_lock = threading.Lock()
+# Ring der letzten JPEGs: ein Writer (Encoder), beliebig viele Leser ohne Lock.
+# Leser teilen sich die (unveränderlichen) bytes-Objekte, kopiert wird nichts.
+# Slot- und Zähler-Zuweisungen sind unter dem GIL atomar; der Writer füllt
+# den Slot, bevor er _seq erhöht.
+_RING_SIZE = 4  # Zweierpotenz
+_ring: list[Optional[bytes]] = [None] * _RING_SIZE
+_seq = 0
+# MJPEG-Clients: je eine Queue, befüllt im Event-Loop via call_soon_threadsafe
+_subscribers: set[asyncio.Queue] = set()
+_loop: Optional[asyncio.AbstractEventLoop] = None
 stop_event = threading.Event()
 threads: list[threading.Thread] = []
+# Grabber -> Encoder: max. 2 Frames, bei Überlauf fliegt der älteste raus
+_encode_queue: queue.Queue = queue.Queue(maxsize=2)
+
+# libjpeg-turbo (SIMD) Encoder, einmalig geladen
+_tj = TurboJPEG()
+_tj_flags = TJFLAG_FASTDCT if JPEG_FASTDCT else 0
+
+
+def _fan_out(data: bytes) -> None:
+    # Läuft im Event-Loop. Ist ein Client noch nicht beim letzten Frame angekommen,
+    # wird dieser verworfen – langsame Clients bekommen immer den neuesten Frame
+    for q in _subscribers:
+        if q.full():
+            q.get_nowait()
+        q.put_nowait(data)
+
+
+def publish_frame(data: bytes) -> None:
+    global _seq
+    _ring[_seq & (_RING_SIZE - 1)] = data
+    _seq += 1
+    loop = _loop
+    if _subscribers and loop is not None:
+        try:
+            loop.call_soon_threadsafe(_fan_out, data)
+        except RuntimeError:
+            # Event-Loop bereits geschlossen (Shutdown)
+            pass
+
+
+def latest_frame() -> Optional[bytes]:
+    s = _seq
+    if not s:
+        return None
+    return _ring[(s - 1) & (_RING_SIZE - 1)]
+
+
+def frame_at(seq: int) -> Optional[bytes]:
+    # Frame Nr. seq (1-basiert), solange er noch nicht aus dem Ring verdrängt wurde
+    if not 0 < seq <= _seq < seq + _RING_SIZE:
+        return None
+    return _ring[(seq - 1) & (_RING_SIZE - 1)]
 
 
 # -------------------------
@@ -53,6 +134,24 @@ def _has_gstreamer_support() -> bool:
     return hasattr(cv2, "CAP_GSTREAMER")
 
 
+def _is_jetson() -> bool:
+    try:
+        with open("/proc/device-tree/model") as f:
+            return "jetson" in f.read().lower()
+    except OSError:
+        return False
+
+
+def _open_with_jetson() -> Optional[cv2.VideoCapture]:
+    if JPEG_PASSTHROUGH or not _has_gstreamer_support() or not _is_jetson():
+        return None
+    cap = cv2.VideoCapture(JETSON_GST_PIPE, cv2.CAP_GSTREAMER)
+    if cap is not None and cap.isOpened():
+        log.info("Capture geöffnet via Jetson HW-Pipeline (nvjpegenc).")
+        return cap
+    return None
+
+
 def _open_with_gstreamer() -> Optional[cv2.VideoCapture]:
     if not _has_gstreamer_support():
         return None
@@ -74,6 +173,9 @@ def _open_with_v4l2() -> Optional[cv2.VideoCapture]:
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, WIDTH)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, HEIGHT)
     cap.set(cv2.CAP_PROP_FPS, FPS)
+    if JPEG_PASSTHROUGH:
+        # Rohe MJPEG-Buffer statt dekodierter BGR-Frames liefern
+        cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
 
     if cap.isOpened():
         log.info("Capture geöffnet via direktes V4L2.")
@@ -81,7 +183,15 @@ def _open_with_v4l2() -> Optional[cv2.VideoCapture]:
     return None
 
 
+def _is_jpeg_frame(frame) -> bool:
+    # Encodierte Frames liefert OpenCV als 1xN uint8-Buffer
+    return frame.ndim == 2 and frame.shape[0] == 1
+
+
 def open_capture() -> cv2.VideoCapture:
+    cap = _open_with_jetson()
+    if cap:
+        return cap
     cap = _open_with_gstreamer()
     if cap:
         return cap
@@ -93,12 +203,118 @@ def open_capture() -> cv2.VideoCapture:
     )
 
 
+# -------------------------
+# Encoding
+# -------------------------
+def _resize_buffer(frame) -> Optional[np.ndarray]:
+    # Zielpuffer für cv2.resize – nur nötig, wenn die Kamera nicht selbst WIDTHxHEIGHT liefert
+    if not WIDTH or not HEIGHT or frame.shape[:2] == (HEIGHT, WIDTH):
+        return None
+    log.info(
+        f"Kamera liefert {frame.shape[1]}x{frame.shape[0]}, skaliere auf {WIDTH}x{HEIGHT}."
+    )
+    return np.empty((HEIGHT, WIDTH) + frame.shape[2:], frame.dtype)
+
+
+def make_converter(frame) -> Callable[[np.ndarray], bytes]:
+    # Frame -> JPEG, einmal pro Capture anhand des ersten Frames spezialisiert:
+    # Entscheidungen (Passthrough, Resize) und Lookups passieren hier, die
+    # zurückgegebene Funktion macht pro Frame nur noch die C-Aufrufe
+    if _is_jpeg_frame(frame):
+        # MJPEG-Passthrough: Kamera-JPEG direkt übernehmen
+        return np.ndarray.tobytes
+
+    flip, resize, encode = cv2.flip, cv2.resize, _tj.encode
+    quality, flags = JPEG_QUALITY, _tj_flags
+    size, interpolation = (WIDTH, HEIGHT), cv2.INTER_AREA
+    scratch = _resize_buffer(frame)
+
+    # libjpeg-turbo komprimiert direkt in diesen Puffer (Worst-Case-Größe),
+    # statt pro Frame selbst einen anzulegen, umzukopieren und freizugeben.
+    # Veröffentlicht wird eine bytes-Kopie des genutzten Teils: Leser halten
+    # Frames beliebig lange, der Puffer wird beim nächsten Frame überschrieben
+    out = bytearray(_tj.buffer_size(frame if scratch is None else scratch, TJSAMP_420))
+    out_view = memoryview(out)
+
+    def jpeg(img: np.ndarray) -> bytes:
+        buf, n = encode(
+            img,
+            quality=quality,
+            pixel_format=TJPF_BGR,
+            jpeg_subsample=TJSAMP_420,
+            flags=flags,
+            dst=out,
+        )
+        return out_view[:n].tobytes() if buf is out else buf
+
+    if scratch is None:
+
+        def convert(frame: np.ndarray) -> bytes:
+            # Rotate image 180 degrees
+            return jpeg(flip(frame, -1))
+
+    else:
+
+        def convert(frame: np.ndarray) -> bytes:
+            # Rotate image 180 degrees, dann in den vorbereiteten Puffer skalieren
+            return jpeg(
+                resize(flip(frame, -1), size, dst=scratch, interpolation=interpolation)
+            )
+
+    return convert
+
+
+@lru_cache(maxsize=8)
+def scaled_snapshot(seq: int, width: int) -> Optional[bytes]:
+    # Thumbnail für /snapshot.jpg?w=…: libjpeg-turbo skaliert schon beim Dekodieren
+    # (1/8 … 1/1), daher die größte Stufe, die in width passt. Pro (Frame, Breite)
+    # wird nur einmal gerechnet, egal wie viele Clients dieselbe Größe abfragen.
+    data = frame_at(seq)
+    if data is None:
+        return None
+    src_width = _tj.decode_header(data)[0]
+    if width >= src_width:
+        return data
+    factors = sorted(_tj.scaling_factors, key=lambda f: f[0] / f[1])
+    factor = factors[0]
+    for num, denom in factors:
+        if -(-src_width * num // denom) <= width:
+            factor = (num, denom)
+    return _tj.scale_with_quality(
+        data, scaling_factor=factor, quality=JPEG_QUALITY, flags=_tj_flags
+    )
+
+
 # -------------------------
 # Worker Threads
 # -------------------------
+def _next_deadline(deadline: float, interval: float) -> float:
+    # Takt auf der monotonen Uhr (immun gegen NTP-Sprünge); wer hinterherhinkt,
+    # setzt neu auf statt in einem Burst aufzuholen
+    return max(deadline + interval, time.monotonic())
+
+
+def _tune_grabber_thread() -> None:
+    # Wirkt unter Linux nur auf den aufrufenden Thread; SCHED_FIFO braucht CAP_SYS_NICE
+    name = threading.current_thread().name
+    if GRABBER_CPUS:
+        try:
+            os.sched_setaffinity(0, GRABBER_CPUS)
+            log.info(f"Thread {name} an CPUs {sorted(GRABBER_CPUS)} gebunden.")
+        except (AttributeError, OSError) as e:
+            log.warning(f"Konnte CPU-Affinität nicht setzen: {e}")
+    if GRABBER_RT_PRIORITY > 0:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(GRABBER_RT_PRIORITY))
+            log.info(
+                f"Thread {name} läuft mit SCHED_FIFO, Priorität {GRABBER_RT_PRIORITY}."
+            )
+        except (AttributeError, OSError) as e:
+            log.warning(f"Konnte SCHED_FIFO nicht setzen: {e}")
+
+
 def grabber_worker():
-    global _last_jpeg
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), JPEG_QUALITY]
+    _tune_grabber_thread()
 
     while not stop_event.is_set():
         try:
@@ -108,82 +324,113 @@ def grabber_worker():
             time.sleep(1.0)
             continue
 
-        while not stop_event.is_set():
-            ok, frame = cap.read()
+        # Frame-Format wird einmal pro Capture bestimmt, nicht pro Frame
+        convert: Optional[Callable[[np.ndarray], bytes]] = None
+        read, stopped = cap.read, stop_event.is_set
+        put, drop = _encode_queue.put_nowait, _encode_queue.get_nowait
+
+        while not stopped():
+            ok, frame = read()
             if not ok or frame is None:
                 log.warning("Frame read failed – versuche Reconnect …")
                 cap.release()
                 time.sleep(0.5)
                 break
 
-            # Rotate image 180 degrees
-            frame = cv2.flip(frame, -1)
-            try:
-                if (
-                    WIDTH
-                    and HEIGHT
-                    and (frame.shape[1] != WIDTH or frame.shape[0] != HEIGHT)
-                ):
-                    frame = cv2.resize(
-                        frame, (WIDTH, HEIGHT), interpolation=cv2.INTER_AREA
-                    )
-            except Exception as e:
-                log.debug(f"Resize skipped: {e}")
+            if convert is None:
+                convert = make_converter(frame)
 
-            ok, buf = cv2.imencode(".jpg", frame, encode_param)
-            if ok:
-                data = buf.tobytes()
-                with _cap_lock:
-                    _last_jpeg = data
-
-            time.sleep(max(0.0, 1.0 / max(FPS, 5)) / 2.0)
+            # Encode läuft im Encoder-Thread, hier sofort weiter mit dem
+            # nächsten read() (blockiert bis zum nächsten Kamera-Frame)
+            item = (convert, frame)
+            while True:
+                try:
+                    put(item)
+                    break
+                except queue.Full:
+                    with suppress(queue.Empty):
+                        drop()
 
         time.sleep(0.2)
 
 
-def prusa_pusher_worker():
+def encoder_worker():
+    _tune_grabber_thread()
+    get = _encode_queue.get
+
+    # Einziger Writer des Frame-Rings
+    while not stop_event.is_set():
+        try:
+            convert, frame = get(timeout=0.5)
+        except queue.Empty:
+            continue
+        publish_frame(convert(frame))
+
+
+# -------------------------
+# Async Tasks
+# -------------------------
+async def prusa_pusher_task():
     if not PRUSA_TOKEN or not PRUSA_FINGERPRINT:
         log.info("PRUSA_TOKEN or PRUSA_FINGERPRINT not set – Prusa upload disabled.")
         return
 
-    url = f"{PRUSA_BASE_URL.rstrip('/')}/c/snapshot"
+    url = httpx.URL(f"{PRUSA_BASE_URL.rstrip('/')}/c/snapshot")
     # Prusa examples consistently show lowercase header names
     headers = {
         "content-type": "image/jpeg",
         "token": PRUSA_TOKEN,
         "fingerprint": PRUSA_FINGERPRINT,
     }
-    sess = requests.Session()
+
+    # Eine Verbindung, die zwischen zwei Uploads offen bleibt (httpx schließt
+    # Idle-Verbindungen sonst nach 5 s – also vor jedem Push neuer TLS-Handshake)
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,  # nur Verbindungsaufbau, PUT wird nicht wiederholt
+        limits=httpx.Limits(
+            max_connections=1,
+            max_keepalive_connections=1,
+            keepalive_expiry=PUSH_EVERY + 5,
+        ),
+        socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+    )
 
     log.info("Prusa pusher active (PUT raw JPEG).")
-    while not stop_event.is_set():
-        time.sleep(PUSH_EVERY)
-        with _cap_lock:
-            data = _last_jpeg
-        if not data:
-            continue
-        try:
-            # IMPORTANT: raw bytes in the body (no multipart)
-            resp = sess.put(url, headers=headers, data=data, timeout=10)
-            if resp.status_code >= 400:
-                log.warning(f"[prusa] HTTP {resp.status_code}: {resp.text[:200]}")
-            else:
-                log.debug("[prusa] snapshot uploaded")
-        except Exception as e:
-            log.warning(f"[prusa] upload failed: {e}")
+    async with httpx.AsyncClient(
+        transport=transport, headers=headers, timeout=10
+    ) as client:
+        deadline = time.monotonic()
+        while not stop_event.is_set():
+            # Upload-Dauer verschiebt den Takt nicht
+            deadline = _next_deadline(deadline, PUSH_EVERY)
+            await asyncio.sleep(deadline - time.monotonic())
+            data = latest_frame()
+            if not data:
+                continue
+            try:
+                # IMPORTANT: raw bytes in the body (no multipart)
+                resp = await client.put(url, content=data)
+                if resp.status_code >= 400:
+                    log.warning(f"[prusa] HTTP {resp.status_code}: {resp.text[:200]}")
+                else:
+                    log.debug("[prusa] snapshot uploaded")
+            except Exception as e:
+                log.warning(f"[prusa] upload failed: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _loop
     # Start
     stop_event.clear()
-    t1 = threading.Thread(target=grabber_worker, name="grabber", daemon=True)
-    t1.start()
-    threads.append(t1)
+    _loop = asyncio.get_running_loop()
+    for target, name in ((grabber_worker, "grabber"), (encoder_worker, "encoder")):
+        t = threading.Thread(target=target, name=name, daemon=True)
+        t.start()
+        threads.append(t)
 
-    t2 = threading.Thread(target=prusa_pusher_worker, name="prusa", daemon=True)
-    t2.start()
-    threads.append(t2)
+    pusher = asyncio.create_task(prusa_pusher_task(), name="prusa")
 
     log.info("Service gestartet. Endpoints: /  /snapshot.jpg  /mjpeg  /health")
     try:
@@ -191,6 +438,10 @@ async def lifespan(app: FastAPI):
     finally:
         # Stop
         stop_event.set()
+        _loop = None
+        pusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await pusher
         # Wir geben Threads Zeit zum sauberen Ausstieg
         for t in threads:
             if t.is_alive():
@@ -212,59 +463,123 @@ app.add_middleware(
 
 
 @app.options("/{full_path:path}")
-def any_options(full_path: str):
+async def any_options(full_path: str):
     # Preflight-Response ohne Content
     return Response(status_code=204)
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 
 @app.get("/snapshot.jpg")
-def snapshot():
-    with _cap_lock:
-        data = _last_jpeg
+async def snapshot(w: Annotated[Optional[int], Query(ge=1)] = None):
+    seq = _seq
+    data = frame_at(seq)
+    if data and w is not None:
+        # Skalieren blockiert – im Threadpool, damit der Event-Loop frei bleibt
+        data = await run_in_threadpool(scaled_snapshot, seq, w) or data
     if not data:
         # Noch kein Frame verfügbar
         return Response(status_code=503)
     return Response(content=data, media_type="image/jpeg")
 
 
-@app.get("/mjpeg")
-def mjpeg():
-    boundary = "frame"
+# Konstante Teile des multipart-Headers, einmalig als bytes
+_BOUNDARY = "frame"
+_BOUNDARY_HEAD = (
+    b"--" + _BOUNDARY.encode() + b"\r\nContent-Type: image/jpeg\r\nContent-Length: "
+)
+_BOUNDARY_MID = b"\r\n\r\n"
+_BOUNDARY_TAIL = b"\r\n"
+
+
+_TAIL_MESSAGE = {
+    "type": "http.response.body",
+    "body": _BOUNDARY_TAIL,
+    "more_body": True,
+}
+
+
+@lru_cache(maxsize=4096)
+def _part_header(length: int) -> bytes:
+    # JPEG-Größen wiederholen sich stark – Header pro Länge nur einmal bauen
+    return b"".join((_BOUNDARY_HEAD, b"%d" % length, _BOUNDARY_MID))
+
+
+class MJPEGResponse(Response):
+    # Schreibt die Frames direkt über ASGI-send – ohne StreamingResponse
+    # (kein Async-Iterator und keine Chunk-Prüfung pro Teil)
+    media_type = f"multipart/x-mixed-replace; boundary={_BOUNDARY}"
+
+    def __init__(self) -> None:
+        # Kein body → init_headers setzt keine Content-Length
+        self.status_code = 200
+        self.background = None
+        self.init_headers({"Cache-Control": "no-store"})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        # Neue Frames kommen per Queue vom Grabber – kein Polling, keine Duplikate
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=1)
+        data = latest_frame()
+        if data:
+            queue.put_nowait(data)
+        _subscribers.add(queue)
+
+        # uvicorn meldet ASGI 2.3: send() nach Disconnect wirft nicht,
+        # also selbst auf http.disconnect hören
+        stream = asyncio.ensure_future(self._stream(queue, send))
+        disconnect = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        try:
+            await asyncio.wait(
+                (stream, disconnect), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stream.cancel()
+            disconnect.cancel()
+            _subscribers.discard(queue)
+        if stream.done() and not stream.cancelled():
+            stream.result()
+
+    @staticmethod
+    async def _stream(queue: asyncio.Queue, send: Send) -> None:
+        get = queue.get
+        while not stop_event.is_set():
+            data = await get()
+            # JPEG als eigener Chunk: alle Clients senden dasselbe
+            # bytes-Objekt aus dem Ring, ohne es pro Client umzukopieren
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": _part_header(len(data)),
+                    "more_body": True,
+                }
+            )
+            await send({"type": "http.response.body", "body": data, "more_body": True})
+            await send(_TAIL_MESSAGE)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    @staticmethod
+    async def _wait_for_disconnect(receive: Receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
 
-    def gen():
-        while True:
-            if stop_event.is_set():
-                break
-            with _cap_lock:
-                data = _last_jpeg
-            if data:
-                yield (
-                    b"--" + boundary.encode() + b"\r\n"
-                    b"Content-Type: image/jpeg\r\n"
-                    b"Content-Length: "
-                    + str(len(data)).encode()
-                    + b"\r\n\r\n"
-                    + data
-                    + b"\r\n"
-                )
-            # Intervall leicht kürzer als FPS, aber nicht zu hoch
-            time.sleep(max(0.02, 1.0 / max(FPS, 5)))
-
-    return StreamingResponse(
-        gen(),
-        media_type=f"multipart/x-mixed-replace; boundary={boundary}",
-        headers={"Cache-Control": "no-store"},
-    )
+
+@app.get("/mjpeg")
+async def mjpeg():
+    return MJPEGResponse()
 
 
-@app.get("/")
-def index():
-    html = """
+# Statische Startseite, einmalig als bytes vorbereitet
+INDEX_HTML = """
     <html>
       <head>
         <title>Printer Cam</title>
@@ -295,4 +610,9 @@ def index():
       </body>
     </html>
     """
-    return Response(content=html, media_type="text/html")
+_INDEX_BODY = INDEX_HTML.encode()
+
+
+@app.get("/")
+async def index():
+    return Response(content=_INDEX_BODY, media_type="text/html")